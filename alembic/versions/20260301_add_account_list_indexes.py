@@ -0,0 +1,49 @@
+"""Add indexes for the accounts list filters and search
+
+Revision ID: c3d4e5f6a7b9
+Revises: b2c3d4e5f7a8
+Create Date: 2026-03-01
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c3d4e5f6a7b9"
+down_revision = "b2c3d4e5f7a8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    dialect = conn.dialect.name  # "sqlite" or "postgresql"
+
+    # Industry filter + name ordering
+    op.create_index("ix_accounts_industry_name", "accounts", ["industry", "name"])
+
+    # Trigram indexes for ILIKE '%term%' search (PostgreSQL only)
+    if dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.create_index(
+            "ix_accounts_name_trgm",
+            "accounts",
+            ["name"],
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        )
+        op.create_index(
+            "ix_accounts_city_trgm",
+            "accounts",
+            ["city"],
+            postgresql_using="gin",
+            postgresql_ops={"city": "gin_trgm_ops"},
+        )
+
+
+def downgrade():
+    conn = op.get_bind()
+    dialect = conn.dialect.name
+
+    if dialect == "postgresql":
+        op.drop_index("ix_accounts_city_trgm", table_name="accounts")
+        op.drop_index("ix_accounts_name_trgm", table_name="accounts")
+    op.drop_index("ix_accounts_industry_name", table_name="accounts")
@@ -0,0 +1,31 @@
+"""Add lower(name) expression index on accounts
+
+Revision ID: d4e5f6a7b8c0
+Revises: c3d4e5f6a7b9
+Create Date: 2026-03-02
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "d4e5f6a7b8c0"
+down_revision = "c3d4e5f6a7b9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    conn = op.get_bind()
+    dialect = conn.dialect.name  # "sqlite" or "postgresql"
+
+    if dialect == "postgresql":
+        # text_pattern_ops also lets LIKE 'prefix%' on lower(name) use the index
+        op.execute(
+            "CREATE INDEX ix_accounts_lower_name ON accounts (lower(name) text_pattern_ops)"
+        )
+    else:
+        op.create_index("ix_accounts_lower_name", "accounts", [sa.text("lower(name)")])
+
+
+def downgrade():
+    op.drop_index("ix_accounts_lower_name", table_name="accounts")
@@ -0,0 +1,22 @@
+"""Add lower(email) expression index on contacts
+
+Revision ID: e5f6a7b8c9d1
+Revises: d4e5f6a7b8c0
+Create Date: 2026-03-03
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "e5f6a7b8c9d1"
+down_revision = "d4e5f6a7b8c0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index("ix_contacts_lower_email", "contacts", [sa.text("lower(email)")])
+
+
+def downgrade():
+    op.drop_index("ix_contacts_lower_email", table_name="contacts")
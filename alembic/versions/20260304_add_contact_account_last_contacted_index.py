@@ -0,0 +1,25 @@
+"""Add (account_id, last_contacted) index on contacts
+
+Revision ID: f6a7b8c9d0e2
+Revises: e5f6a7b8c9d1
+Create Date: 2026-03-04
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f6a7b8c9d0e2"
+down_revision = "e5f6a7b8c9d1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_contacts_account_last_contacted",
+        "contacts",
+        ["account_id", "last_contacted"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_contacts_account_last_contacted", table_name="contacts")
@@ -0,0 +1,27 @@
+"""Add (name, id) covering index for the accounts list
+
+Revision ID: a7b8c9d0e1f3
+Revises: f6a7b8c9d0e2
+Create Date: 2026-03-05
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a7b8c9d0e1f3"
+down_revision = "f6a7b8c9d0e2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # INCLUDE is PostgreSQL-only; other dialects get a plain (name, id) index
+    op.create_index(
+        "ix_accounts_name_id",
+        "accounts",
+        ["name", "id"],
+        postgresql_include=["account_type", "industry", "is_hot", "awaiting_response"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_accounts_name_id", table_name="accounts")
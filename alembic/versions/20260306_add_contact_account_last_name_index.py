@@ -0,0 +1,27 @@
+"""Add (account_id, last_name) covering index for the activity contact picker
+
+Revision ID: b8c9d0e1f2a4
+Revises: a7b8c9d0e1f3
+Create Date: 2026-03-06
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b8c9d0e1f2a4"
+down_revision = "a7b8c9d0e1f3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # INCLUDE is PostgreSQL-only; other dialects get a plain (account_id, last_name) index
+    op.create_index(
+        "ix_contacts_account_last_name",
+        "contacts",
+        ["account_id", "last_name"],
+        postgresql_include=["id", "first_name", "title"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_contacts_account_last_name", table_name="contacts")
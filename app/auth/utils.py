@@ -47,12 +47,30 @@ def get_current_user_optional(
     """
     Get the current user from session if logged in.
     Returns None if not authenticated.
+
+    The user is memoized on request.state.current_user (also set by
+    AuthMiddleware), so repeated calls within a request don't re-query.
+    AuthMiddleware loads it from its own, already closed session, so it is
+    merged into this request's session (without a SELECT) before use;
+    relationship access on the returned user then works normally.
     """
+    cached = getattr(request.state, "current_user", None)
+    if cached is not None:
+        if cached not in db:
+            cached = db.merge(cached, load=False)
+            request.state.current_user = cached
+        return cached
+
     user_id = request.session.get("user_id")
     if not user_id:
         return None
 
-    return db.query(User).filter(User.id == user_id, User.is_active.is_(True)).first()
+    # Primary-key lookup goes through the session identity map first
+    user = db.get(User, user_id)
+    if not user or not user.is_active:
+        return None
+    request.state.current_user = user
+    return user
 
 
 def get_current_user(request: Request, db: Session = Depends(get_db)) -> User:
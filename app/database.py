@@ -24,8 +24,20 @@ def get_database_url() -> str:
 def get_engine():
     """Get or create database engine."""
     DATABASE_URL = get_database_url()
+    kwargs = {}
+    if DATABASE_URL.startswith("postgresql"):
+        # The pool is per process: each worker can open up to
+        # pool_size + max_overflow connections, so the total across workers
+        # must stay under the server's max_connections (100 by default).
+        # pre_ping/recycle drop connections the server closed.
+        kwargs.update(
+            pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+            pool_pre_ping=True,
+            pool_recycle=300,
+        )
     return create_engine(
-        DATABASE_URL, echo=os.getenv("DEBUG", "false").lower() == "true"
+        DATABASE_URL, echo=os.getenv("DEBUG", "false").lower() == "true", **kwargs
     )
 
 
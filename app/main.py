@@ -10,6 +10,7 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from app.routes import (
+    auth_router,
     dashboard_router,
     accounts_router,
     contacts_router,
@@ -26,7 +27,6 @@ from app.routes import (
     commissions_router,
     daily_summary_router,
 )
-from app.routes.auth import router as auth_router
 from app.database import SessionLocal
 from app.models import User
 
@@ -1,5 +1,6 @@
 from datetime import datetime, date
-from sqlalchemy import Column, Integer, String, Text, DateTime, Date, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Date, Boolean, ForeignKey, Index, func, select
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -52,12 +53,46 @@ class Account(Base):
         cascade="all, delete-orphan",
     )
 
+    # Indexes backing the list page filters:
+    # - (name, id) matches the default order and keyset cursor; on PostgreSQL
+    #   it INCLUDEs the other list columns so pages are index-only scans
+    # - (industry, name) serves the industry filter already ordered by name
+    # - trigram GIN indexes serve the ILIKE '%term%' search on name/city
+    # - lower(name) serves case-insensitive equality/prefix matches on name
+    __table_args__ = (
+        Index(
+            "ix_accounts_name_id",
+            "name",
+            "id",
+            postgresql_include=["account_type", "industry", "is_hot", "awaiting_response"],
+        ),
+        Index("ix_accounts_industry_name", "industry", "name"),
+        Index(
+            "ix_accounts_lower_name",
+            func.lower(name).label("lower_name"),
+            postgresql_ops={"lower_name": "text_pattern_ops"},
+        ),
+        Index(
+            "ix_accounts_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_accounts_city_trgm",
+            "city",
+            postgresql_using="gin",
+            postgresql_ops={"city": "gin_trgm_ops"},
+        ),
+    )
+
     # Simplified - removed GC type
-    ACCOUNT_TYPES = [
+    ACCOUNT_TYPES = (
         ("end_user", "End User"),
-    ]
+    )
+    _ACCOUNT_TYPE_MAP = dict(ACCOUNT_TYPES)
 
-    INDUSTRIES = [
+    INDUSTRIES = (
         "Construction",
         "Manufacturing",
         "Healthcare",
@@ -69,13 +104,12 @@ class Account(Base):
         "Real Estate",
         "Hospitality",
         "Other",
-    ]
+    )
 
     @property
     def account_type_display(self):
         """Get display name for account type."""
-        type_map = dict(self.ACCOUNT_TYPES)
-        return type_map.get(self.account_type, self.account_type)
+        return self._ACCOUNT_TYPE_MAP.get(self.account_type, self.account_type)
 
     @property
     def full_address(self):
@@ -123,12 +157,26 @@ class Account(Base):
         """Get all opportunities linked to this account."""
         return [link.opportunity for link in self.opportunity_links]
 
-    @property
+    @hybrid_property
     def last_contacted(self):
         """Get the most recent last_contacted date from all contacts."""
         dates = [c.last_contacted for c in self.contacts if c.last_contacted]
         return max(dates) if dates else None
 
+    @last_contacted.inplace.expression
+    @classmethod
+    def _last_contacted_expression(cls):
+        """Correlated MAX(contacts.last_contacted) so queries can filter/order by it."""
+        # Resolved through the relationship, like the string targets above,
+        # so this module doesn't import contact.py
+        Contact = cls.contacts.property.mapper.class_
+        return (
+            select(func.max(Contact.last_contacted))
+            .where(Contact.account_id == cls.id)
+            .correlate_except(Contact)
+            .scalar_subquery()
+        )
+
     @property
     def days_since_last_activity(self):
         """Days since last contact with any contact at this account."""
@@ -8,6 +8,8 @@ from sqlalchemy import (
     Date,
     Boolean,
     ForeignKey,
+    Index,
+    func,
 )
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -39,6 +41,20 @@ class Contact(Base):
         DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
     )
 
+    __table_args__ = (
+        # Case-insensitive duplicate email check in validate_contact
+        Index("ix_contacts_lower_email", func.lower(email)),
+        # Account page contact ordering and the list's max(last_contacted)
+        Index("ix_contacts_account_last_contacted", "account_id", "last_contacted"),
+        # Activity edit form's contact picker (account_id = ? ORDER BY last_name)
+        Index(
+            "ix_contacts_account_last_name",
+            "account_id",
+            "last_name",
+            postgresql_include=["id", "first_name", "title"],
+        ),
+    )
+
     # Relationships
     account = relationship("Account", back_populates="contacts")
     opportunities = relationship("Opportunity", back_populates="primary_contact")
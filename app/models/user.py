@@ -4,6 +4,18 @@ from sqlalchemy.orm import relationship
 from app.database import Base
 
 
+# Role -> edit-permission check for User.can_edit_opportunity
+_EDIT_OPPORTUNITY_CHECKS = {
+    "Admin": lambda user, opp: True,
+    "Sales": lambda user, opp: opp.owner_id == user.id,
+    "Estimator": lambda user, opp: opp.assigned_estimator_id == user.id,
+}
+
+
+def _deny_edit(user, opp):
+    return False
+
+
 class User(Base):
     __tablename__ = "users"
 
@@ -48,7 +60,7 @@ class User(Base):
         passive_deletes=True,
     )
 
-    ROLES = ["Admin", "Sales", "Estimator"]
+    ROLES = ("Admin", "Sales", "Estimator")
 
     @property
     def is_admin(self):
@@ -64,13 +76,8 @@ class User(Base):
 
     def can_edit_opportunity(self, opportunity):
         """Check if user can edit an opportunity."""
-        if self.is_admin:
-            return True
-        if self.is_sales and opportunity.owner_id == self.id:
-            return True
-        if self.is_estimator and opportunity.assigned_estimator_id == self.id:
-            return True
-        return False
+        check = _EDIT_OPPORTUNITY_CHECKS.get(self.role, _deny_edit)
+        return check(self, opportunity)
 
     def __repr__(self):
         return f"<User {self.email}>"
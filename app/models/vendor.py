@@ -34,7 +34,7 @@ class Vendor(Base):
     # Relationships
     quote_requests = relationship("VendorQuoteRequest", back_populates="vendor")
 
-    SPECIALTIES = [
+    SPECIALTIES = (
         "Electrical",
         "Plumbing",
         "HVAC",
@@ -47,7 +47,7 @@ class Vendor(Base):
         "Equipment",
         "General Materials",
         "Other",
-    ]
+    )
 
     def __repr__(self):
         return f"<Vendor {self.name}>"
@@ -82,12 +82,13 @@ class VendorQuoteRequest(Base):
     vendor = relationship("Vendor", back_populates="quote_requests")
     created_by = relationship("User")
 
-    STATUSES = ["Pending", "Sent", "Received", "Declined", "Expired"]
+    STATUSES = ("Pending", "Sent", "Received", "Declined", "Expired")
+    _TERMINAL_STATUSES = frozenset({"Received", "Declined", "Expired"})
 
     @property
     def is_overdue(self):
         """Check if quote request is overdue."""
-        if self.status in ["Received", "Declined", "Expired"]:
+        if self.status in self._TERMINAL_STATUSES:
             return False
         if self.due_date:
             return self.due_date < datetime.now().date()
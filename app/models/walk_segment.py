@@ -26,20 +26,18 @@ class WalkSegment(Base):
 
     activity = relationship("Activity", back_populates="walk_segments")
 
-    SEGMENT_TYPES = [
+    SEGMENT_TYPES = (
         ("idf", "IDF"),
         ("mdf", "MDF"),
         ("room", "Room"),
         ("closet", "Telecom Closet"),
         ("other", "Other"),
-    ]
+    )
+    _SEGMENT_TYPE_MAP = dict(SEGMENT_TYPES)
 
     @property
     def type_display(self):
-        for code, name in self.SEGMENT_TYPES:
-            if code == self.segment_type:
-                return name
-        return self.segment_type
+        return self._SEGMENT_TYPE_MAP.get(self.segment_type, self.segment_type)
 
     @property
     def quantity_display(self):
@@ -41,7 +41,8 @@ class WeeklySummaryNote(Base):
     )
 
     # Valid section names
-    SECTIONS = ["outreach", "pipeline", "tasks", "new_records", "other"]
+    SECTIONS = ("outreach", "pipeline", "tasks", "new_records", "other")
+    VALID_SECTIONS = frozenset(SECTIONS)
 
     def __repr__(self):
         return f"<WeeklySummaryNote {self.week_start} - {self.section} - user:{self.user_id}>"
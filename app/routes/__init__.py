@@ -1,33 +1,44 @@
-from app.routes.dashboard import router as dashboard_router
-from app.routes.accounts import router as accounts_router
-from app.routes.contacts import router as contacts_router
-from app.routes.opportunities import router as opportunities_router
-from app.routes.estimates import router as estimates_router
-from app.routes.activities import router as activities_router
-from app.routes.tasks import router as tasks_router
-from app.routes.guide import router as guide_router
-from app.routes.estimators import router as estimators_router
-from app.routes.summary import router as summary_router
-from app.routes.today import router as today_router
-from app.routes.audit_log import router as audit_log_router
-from app.routes.job_walks import router as job_walks_router
-from app.routes.commissions import router as commissions_router
-from app.routes.daily_summary import router as daily_summary_router
-
-__all__ = [
-    "dashboard_router",
-    "accounts_router",
-    "contacts_router",
-    "opportunities_router",
-    "estimates_router",
-    "activities_router",
-    "tasks_router",
-    "guide_router",
-    "estimators_router",
-    "summary_router",
-    "today_router",
-    "audit_log_router",
-    "job_walks_router",
-    "commissions_router",
-    "daily_summary_router",
-]
+"""Route modules.
+
+Routers are imported lazily (PEP 562) so that importing one route module,
+e.g. in a test or script, doesn't load every other router and its
+dependencies. `from app.routes import accounts_router` works as before.
+"""
+
+import importlib
+
+# Exported router name -> module that defines `router`
+_ROUTER_MODULES = {
+    "auth_router": "app.routes.auth",
+    "dashboard_router": "app.routes.dashboard",
+    "accounts_router": "app.routes.accounts",
+    "contacts_router": "app.routes.contacts",
+    "opportunities_router": "app.routes.opportunities",
+    "estimates_router": "app.routes.estimates",
+    "activities_router": "app.routes.activities",
+    "tasks_router": "app.routes.tasks",
+    "guide_router": "app.routes.guide",
+    "estimators_router": "app.routes.estimators",
+    "summary_router": "app.routes.summary",
+    "today_router": "app.routes.today",
+    "audit_log_router": "app.routes.audit_log",
+    "job_walks_router": "app.routes.job_walks",
+    "commissions_router": "app.routes.commissions",
+    "daily_summary_router": "app.routes.daily_summary",
+}
+
+__all__ = list(_ROUTER_MODULES)
+
+
+def __getattr__(name):
+    module_path = _ROUTER_MODULES.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    router = importlib.import_module(module_path).router
+    # Cache so later lookups skip __getattr__
+    globals()[name] = router
+    return router
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -1,33 +1,112 @@
+import base64
+import json
 from typing import Optional
+from urllib.parse import urlencode
 
 from fastapi import APIRouter, Request, Depends, Form, HTTPException
-from fastapi.responses import HTMLResponse, RedirectResponse
-from sqlalchemy.orm import Session, selectinload
-from sqlalchemy import or_, func
+from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, selectinload, raiseload
+from sqlalchemy import (
+    delete,
+    distinct,
+    exists,
+    func,
+    insert,
+    lambda_stmt,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 from datetime import date
 
+from app.auth import get_current_user
 from app.database import get_db
-from app.models import Account, Opportunity, Contact, Activity, ActivityAttendee, Task
+from app.models import (
+    Account,
+    Opportunity,
+    OpportunityAccount,
+    Contact,
+    Activity,
+    ActivityAttendee,
+    Task,
+    User,
+)
 from app.models.commission_entry import CommissionEntry
 from app.services.validators import validate_account
 from app.template_config import templates
+from app.utils.form_dates import parse_form_date
+from app.utils.http_cache import (
+    conditional_response,
+    make_etag,
+    not_modified,
+    set_cache_headers,
+)
 from app.utils.safe_redirect import safe_redirect_url
+from app.utils.url import normalize_url
 
 router = APIRouter(prefix="/accounts", tags=["accounts"])
 
+# Accounts per page on the list view (name-ordered listings only)
+PAGE_SIZE = 50
+
+# Form choices passed to every account template
+_INDUSTRIES = Account.INDUSTRIES
+_ACCOUNT_TYPES = Account.ACCOUNT_TYPES
+
+
+# Per-account aggregates the list can sort by. They don't depend on the
+# request, so they are built once here instead of on every list request.
+
+# Total touchpoints across all of the account's contacts
+_ACTIVITY_COUNT_SUBQ = (
+    select(Contact.account_id, func.count(Activity.id).label("activity_count"))
+    .join(Activity, Activity.contact_id == Contact.id)
+    .group_by(Contact.account_id)
+    .subquery()
+)
+
+# Grouped form of Account.last_contacted, joined once for the whole page
+# rather than evaluated as a correlated subquery per row
+_LAST_CONTACTED_SUBQ = (
+    select(Contact.account_id, func.max(Contact.last_contacted).label("last_contacted"))
+    .group_by(Contact.account_id)
+    .subquery()
+)
+
+# total_pipeline_value is a Python property (open opportunities only)
+_PIPELINE_VALUE_SUBQ = (
+    select(
+        Opportunity.account_id,
+        func.sum(Opportunity.lv_value + Opportunity.hdd_value).label("total_value"),
+    )
+    .where(Opportunity.stage.notin_(["Won", "Lost"]))
+    .group_by(Opportunity.account_id)
+    .subquery()
+)
+
+
+def _encode_cursor(name: str, account_id: int) -> str:
+    """Encode the (name, id) of the last row on a page as an opaque cursor."""
+    raw = json.dumps([name, account_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
 
-def normalize_url(url: Optional[str]) -> Optional[str]:
-    """Prepend https:// if URL doesn't start with http:// or https://."""
-    if not url:
+def _decode_cursor(cursor: Optional[str]) -> Optional[tuple]:
+    """Decode a list cursor back to (name, id). Returns None if missing or malformed."""
+    if not cursor:
+        return None
+    try:
+        name, account_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return str(name), int(account_id)
+    except (ValueError, TypeError):
         return None
-    url = url.strip()
-    if url and not url.startswith(("http://", "https://")):
-        return f"https://{url}"
-    return url
 
 
 @router.get("", response_class=HTMLResponse)
-async def list_accounts(
+def list_accounts(
     request: Request,
     search: str = None,
     industry: str = None,
@@ -35,25 +114,33 @@ async def list_accounts(
     view: str = None,
     sort: str = None,
     dir: str = None,
+    cursor: str = None,
+    page: int = 1,
     db: Session = Depends(get_db),
 ):
-    """List all accounts with optional filtering."""
-    # Eager load contacts and opportunities to avoid N+1 for:
-    # - account.contacts (for length count in template)
-    # - account.last_contacted property (iterates contacts)
-    # - account.open_opportunities_count property (iterates opportunities)
-    # - account.total_pipeline_value property (iterates opportunities)
-    query = db.query(Account).options(
-        selectinload(Account.contacts), selectinload(Account.opportunities)
+    """List accounts with optional filtering.
+
+    Every ordering is done in SQL so each response is bounded to one page.
+    Name-ordered listings are paginated with a keyset cursor over
+    (name, id); the aggregate-based orderings use page numbers.
+    """
+    # Contact count / last contacted are computed in one grouped query
+    # below instead of eager loading every Contact row.
+    # Select only the columns list.html reads: plain rows skip ORM
+    # hydration and the identity map, and cannot lazy load relationships.
+    query = db.query(
+        Account.id,
+        Account.name,
+        Account.account_type,
+        Account.industry,
+        Account.is_hot,
+        Account.awaiting_response,
     )
 
+    # Substring search; served by the pg_trgm GIN indexes on name and city
     if search:
-        query = query.filter(
-            or_(
-                Account.name.ilike(f"%{search}%"),
-                Account.city.ilike(f"%{search}%"),
-            )
-        )
+        term = f"%{search}%"
+        query = query.filter(or_(Account.name.ilike(term), Account.city.ilike(term)))
 
     if industry:
         query = query.filter(Account.industry == industry)
@@ -72,110 +159,220 @@ async def list_accounts(
     # Normalize direction
     direction = dir if dir in ("asc", "desc") else None
 
-    # SQL-safe sorting (only real DB columns)
-    if sort == "name":
+    # Only name orderings can use the (name, id) keyset cursor; orderings on
+    # per-account aggregates page by LIMIT/OFFSET
+    keyset = sort not in ("value", "last_activity", "activities") and view not in (
+        "waiting",
+        "hot",
+    )
+    page = max(1, page)
+
+    # SQL-safe sorting (only real DB columns). The activities sort wins over
+    # the waiting/hot views, which win over the remaining sorts.
+    if sort == "activities":
+        activity_subq = _ACTIVITY_COUNT_SUBQ
+        activity_count = func.coalesce(activity_subq.c.activity_count, 0)
+        query = query.outerjoin(
+            activity_subq, Account.id == activity_subq.c.account_id
+        ).order_by(
+            # Default to desc
+            activity_count.asc() if direction == "asc" else activity_count.desc(),
+            Account.name.asc(),
+            Account.id.asc(),
+        )
+    elif view in ("waiting", "hot") or sort == "last_activity":
+        last_contact_subq = _LAST_CONTACTED_SUBQ
+        query = query.outerjoin(
+            last_contact_subq, Account.id == last_contact_subq.c.account_id
+        )
+        # Waiting/hot views list the stalest accounts first. last_activity
+        # defaults to desc; never-contacted accounts sort as oldest.
+        if view in ("waiting", "hot") or direction == "asc":
+            query = query.order_by(
+                last_contact_subq.c.last_contacted.asc().nullsfirst(),
+                Account.name.asc(),
+                Account.id.asc(),
+            )
+        else:
+            query = query.order_by(
+                last_contact_subq.c.last_contacted.desc().nullslast(),
+                Account.name.asc(),
+                Account.id.asc(),
+            )
+    elif sort == "name":
+        # id tiebreaker keeps the ordering stable for the keyset cursor
         if direction == "desc":
-            query = query.order_by(Account.name.desc())
+            query = query.order_by(Account.name.desc(), Account.id.desc())
         else:
-            query = query.order_by(Account.name.asc())
+            query = query.order_by(Account.name.asc(), Account.id.asc())
     elif sort == "value":
-        # Subquery needed because total_pipeline_value is a Python property
-        pipeline_subq = (
-            db.query(
-                Opportunity.account_id,
-                func.sum(Opportunity.lv_value + Opportunity.hdd_value).label(
-                    "total_value"
-                ),
-            )
-            .filter(Opportunity.stage.notin_(["Won", "Lost"]))
-            .group_by(Opportunity.account_id)
-            .subquery()
-        )
+        pipeline_subq = _PIPELINE_VALUE_SUBQ
         query = query.outerjoin(
             pipeline_subq, Account.id == pipeline_subq.c.account_id
-        ).order_by(pipeline_subq.c.total_value.desc().nullslast())
-    elif sort not in ("last_activity", "activities") and view not in ("waiting", "hot"):
-        # Default sort (skip if last_activity or waiting/hot view - handled in Python below)
-        query = query.order_by(Account.name.asc())
-
-    accounts = query.all()
-
-    # Python-side sort for last_activity (it's a @property, not a DB column)
-    if sort == "last_activity":
-        reverse_sort = direction != "asc"  # Default to desc for last_activity
-        accounts.sort(
-            key=lambda a: a.last_contacted or date.min,
-            reverse=reverse_sort,
+        ).order_by(
+            pipeline_subq.c.total_value.desc().nullslast(),
+            Account.name.asc(),
+            Account.id.asc(),
         )
+    else:
+        query = query.order_by(Account.name.asc(), Account.id.asc())
 
-    # For "waiting" and "hot" views: sort by days_since_last_activity desc
-    if view in ("waiting", "hot"):
-        accounts.sort(
-            key=lambda a: a.days_since_last_activity if a.days_since_last_activity is not None else 9999,
-            reverse=True,
-        )
+    # Count the full filtered result before narrowing to one page
+    total_count = (
+        query.order_by(None).with_entities(func.count(Account.id)).scalar()
+    )
+    if keyset:
+        after = _decode_cursor(cursor)
+        if after:
+            row_key = tuple_(Account.name, Account.id)
+            if sort == "name" and direction == "desc":
+                query = query.filter(row_key < tuple_(*after))
+            else:
+                query = query.filter(row_key > tuple_(*after))
+    else:
+        query = query.offset((page - 1) * PAGE_SIZE)
+
+    # Fetch one extra row to know whether there is a next page
+    accounts = query.limit(PAGE_SIZE + 1).all()
+    next_params = None
+    if len(accounts) > PAGE_SIZE:
+        accounts = accounts[:PAGE_SIZE]
+        if keyset:
+            next_params = {"cursor": _encode_cursor(accounts[-1].name, accounts[-1].id)}
+        else:
+            next_params = {"page": page + 1}
 
-    # Build activity count per account (total touchpoints across all contacts)
+    # Per-account contact stats and activity count (total touchpoints across
+    # all contacts) for the listed accounts, in a single grouped query
     account_ids = [a.id for a in accounts]
+    contact_stats = {
+        account_id: {
+            "contact_count": 0,
+            "last_contacted": None,
+            "days_since_last_activity": None,
+        }
+        for account_id in account_ids
+    }
     activity_counts = {}
     if account_ids:
         rows = (
-            db.query(Contact.account_id, func.count(Activity.id))
-            .join(Activity, Activity.contact_id == Contact.id)
+            db.query(
+                Contact.account_id,
+                func.count(distinct(Contact.id)),
+                func.max(Contact.last_contacted),
+                func.count(Activity.id),
+            )
+            .outerjoin(Activity, Activity.contact_id == Contact.id)
             .filter(Contact.account_id.in_(account_ids))
             .group_by(Contact.account_id)
             .all()
         )
-        activity_counts = {row[0]: row[1] for row in rows}
-
-    # Python-side sort for activities count
-    if sort == "activities":
-        reverse_sort = direction != "asc"  # Default to desc
-        accounts.sort(
-            key=lambda a: activity_counts.get(a.id, 0),
-            reverse=reverse_sort,
-        )
+        today = date.today()
+        for account_id, contact_count, last_contacted, activity_count in rows:
+            stats = contact_stats[account_id]
+            stats["contact_count"] = contact_count
+            stats["last_contacted"] = last_contacted
+            if last_contacted:
+                stats["days_since_last_activity"] = (today - last_contacted).days
+            if activity_count:
+                activity_counts[account_id] = activity_count
 
     # Build query string for preserving state in navigation
-    query_string = str(request.query_params) if request.query_params else ""
+    query_string = request.url.query
 
-    return templates.TemplateResponse(
+    # Pagination links keep the current filters and only swap cursor/page
+    page_params = {
+        k: v for k, v in request.query_params.items() if k not in ("cursor", "page")
+    }
+    next_page_query = urlencode({**page_params, **next_params}) if next_params else None
+    first_page_query = urlencode(page_params) if (cursor or page > 1) else None
+
+    response = templates.TemplateResponse(
         "accounts/list.html",
         {
             "request": request,
             "accounts": accounts,
             "search": search,
             "industry": industry,
-            "industries": Account.INDUSTRIES,
+            "industries": _INDUSTRIES,
             "account_type": account_type,
-            "account_types": Account.ACCOUNT_TYPES,
+            "account_types": _ACCOUNT_TYPES,
             "view": view,
             "sort": sort,
             "dir": direction or ("asc" if sort == "name" else "desc"),
             "list_query_string": query_string,
             "activity_counts": activity_counts,
+            "contact_stats": contact_stats,
+            "total_count": total_count,
+            "next_page_query": next_page_query,
+            "first_page_query": first_page_query,
         },
     )
+    # The page depends on accounts, contacts, activities and opportunities,
+    # so it is versioned by its rendered body rather than by table aggregates
+    # (activities have no updated_at, so a reassigned activity would not move
+    # any cheap key). A 304 therefore still runs every query and renders the
+    # template; it only saves the response bytes.
+    return conditional_response(request, response)
 
 
 @router.get("/new", response_class=HTMLResponse)
-async def new_account_form(request: Request, db: Session = Depends(get_db)):
+def new_account_form(request: Request, db: Session = Depends(get_db)):
     """Display new account form."""
-    return templates.TemplateResponse(
+    etag = make_etag(request, "accounts/new")
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+
+    response = templates.TemplateResponse(
         "accounts/form.html",
         {
             "request": request,
             "account": None,
-            "industries": Account.INDUSTRIES,
+            "industries": _INDUSTRIES,
             "is_new": True,
             "error": None,
             "warnings": [],
         },
     )
+    return set_cache_headers(response, etag)
+
+
+def _form_context(request: Request, account, result, **form) -> dict:
+    """Template context for re-rendering the account form after a failed submit.
+
+    Submitted values are passed as form_<field>; blocking errors take
+    precedence over warnings.
+    """
+    context = {
+        "request": request,
+        "account": account,
+        "display_website": normalize_url(form.get("website")) if account else None,
+        "industries": _INDUSTRIES,
+        "is_new": account is None,
+        "error": "; ".join(result.errors) if not result.is_valid else None,
+        "warnings": result.warnings if result.is_valid else [],
+    }
+    for field, value in form.items():
+        context[f"form_{field}"] = value
+    return context
+
+
+def _account_values(name, account_type, website, **optional) -> dict:
+    """Column values for a submitted account form.
+
+    Blank optional fields are stored as NULL rather than empty strings.
+    """
+    return {
+        "name": name,
+        "account_type": account_type or "end_user",
+        "website": normalize_url(website),
+        **{field: value or None for field, value in optional.items()},
+    }
 
 
 @router.post("/new")
-async def create_account(
+def create_account(
     request: Request,
     name: str = Form(...),
     account_type: str = Form("end_user"),
@@ -189,10 +386,9 @@ async def create_account(
     notes: str = Form(None),
     confirm_warnings: bool = Form(False),
     db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
 ):
     """Create a new account with validation."""
-    current_user = request.state.current_user
-
     # Build data dict for validation
     data = {
         "name": name,
@@ -204,126 +400,107 @@ async def create_account(
     # Validate account data
     result = validate_account(data, db, existing_id=None)
 
-    # If errors, re-render form with error message
-    if not result.is_valid:
-        return templates.TemplateResponse(
-            "accounts/form.html",
-            {
-                "request": request,
-                "account": None,
-                "industries": Account.INDUSTRIES,
-                "is_new": True,
-                "error": "; ".join(result.errors),
-                "warnings": [],
-                # Preserve form values
-                "form_name": name,
-                "form_account_type": account_type,
-                "form_industry": industry,
-                "form_website": website,
-                "form_phone": phone,
-                "form_address": address,
-                "form_city": city,
-                "form_state": state,
-                "form_zip_code": zip_code,
-                "form_notes": notes,
-            },
+    # If errors or unconfirmed warnings, re-render the form with the
+    # submitted values
+    if not result.is_valid or (result.warnings and not confirm_warnings):
+        context = _form_context(
+            request,
+            None,
+            result,
+            name=name,
+            account_type=account_type,
+            industry=industry,
+            website=website,
+            phone=phone,
+            address=address,
+            city=city,
+            state=state,
+            zip_code=zip_code,
+            notes=notes,
         )
-
-    # If warnings and not confirmed, show warnings
-    if result.warnings and not confirm_warnings:
-        return templates.TemplateResponse(
-            "accounts/form.html",
-            {
-                "request": request,
-                "account": None,
-                "industries": Account.INDUSTRIES,
-                "is_new": True,
-                "error": None,
-                "warnings": result.warnings,
-                # Preserve form values
-                "form_name": name,
-                "form_account_type": account_type,
-                "form_industry": industry,
-                "form_website": website,
-                "form_phone": phone,
-                "form_address": address,
-                "form_city": city,
-                "form_state": state,
-                "form_zip_code": zip_code,
-                "form_notes": notes,
-            },
+        return templates.TemplateResponse("accounts/form.html", context)
+
+    # Create account with ownership (Core INSERT ... RETURNING, no ORM flush)
+    new_id = db.execute(
+        insert(Account)
+        .values(
+            **_account_values(
+                name,
+                account_type,
+                website,
+                industry=industry,
+                phone=phone,
+                address=address,
+                city=city,
+                state=state,
+                zip_code=zip_code,
+                notes=notes,
+            ),
+            created_by_id=current_user.id,
         )
-
-    # Create account with ownership
-    account = Account(
-        name=name,
-        account_type=account_type or "end_user",
-        industry=industry or None,
-        website=normalize_url(website),
-        phone=phone or None,
-        address=address or None,
-        city=city or None,
-        state=state or None,
-        zip_code=zip_code or None,
-        notes=notes or None,
-        created_by_id=current_user.id,
-    )
-
-    db.add(account)
+        .returning(Account.id)
+    ).scalar_one()
     db.commit()
 
-    return RedirectResponse(url=f"/accounts/{account.id}", status_code=303)
+    return RedirectResponse(url=f"/accounts/{new_id}", status_code=303)
 
 
 @router.get("/{account_id}", response_class=HTMLResponse)
-async def view_account(
+def view_account(
     request: Request, account_id: int, db: Session = Depends(get_db)
 ):
     """View account details."""
-    # Eager load contacts and opportunities to avoid N+1 in template
-    # Template accesses account.contacts (list) and account.opportunities (list)
-    account = (
-        db.query(Account)
-        .options(selectinload(Account.contacts), selectinload(Account.opportunities))
-        .filter(Account.id == account_id)
-        .first()
+    # Eager load opportunities to avoid N+1 in template, limited to the
+    # columns the opportunities table shows (value = lv_value + hdd_value).
+    # Contacts are loaded below in display order; any other relationship or
+    # opportunity column access raises instead of lazy loading
+    account = db.get(
+        Account,
+        account_id,
+        options=[
+            selectinload(Account.opportunities).load_only(
+                Opportunity.id,
+                Opportunity.name,
+                Opportunity.stage,
+                Opportunity.lv_value,
+                Opportunity.hdd_value,
+                Opportunity.bid_date,
+                raiseload=True,
+            ),
+            raiseload("*"),
+        ],
     )
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
 
-    # Sort contacts by last_contacted DESC (most recent first), nulls last
-    sorted_contacts = sorted(
-        account.contacts,
-        key=lambda c: (c.last_contacted is None, -(c.last_contacted.toordinal() if c.last_contacted else 0)),
+    # Contacts by last_contacted DESC (most recent first), nulls last
+    sorted_contacts = (
+        db.query(Contact)
+        .filter(Contact.account_id == account_id)
+        .order_by(Contact.last_contacted.desc().nullslast(), Contact.id)
+        .all()
     )
 
     # Get meetings for this account (via contact_id or attendee_links)
-    contact_ids = [c.id for c in account.contacts]
+    contact_ids = [c.id for c in sorted_contacts]
     account_meetings = []
     if contact_ids:
-        from sqlalchemy import or_
-        from sqlalchemy.orm import selectinload as sl
-        # Subquery: unique meeting IDs linked to this account's contacts
-        meeting_ids_sub = (
-            db.query(Activity.id)
-            .outerjoin(ActivityAttendee, ActivityAttendee.activity_id == Activity.id)
-            .filter(
-                Activity.activity_type == "meeting",
-                or_(
-                    Activity.contact_id.in_(contact_ids),
-                    ActivityAttendee.contact_id.in_(contact_ids),
-                ),
-            )
-            .distinct()
-            .subquery()
+        # Meetings logged against one of the contacts, or attended by one;
+        # EXISTS avoids the duplicate rows a join on attendees would produce
+        attended = exists().where(
+            ActivityAttendee.activity_id == Activity.id,
+            ActivityAttendee.contact_id.in_(contact_ids),
         )
         account_meetings = (
             db.query(Activity)
             .options(
-                sl(Activity.contact),
-                sl(Activity.attendee_links).selectinload(ActivityAttendee.contact),
+                selectinload(Activity.contact),
+                selectinload(Activity.attendee_links).selectinload(ActivityAttendee.contact),
+            )
+            .filter(
+                Activity.activity_type == "meeting",
+                or_(Activity.contact_id.in_(contact_ids), attended),
             )
-            .filter(Activity.id.in_(meeting_ids_sub))
             .order_by(Activity.activity_date.desc())
             .all()
         )
@@ -373,33 +550,41 @@ async def view_account(
 
 
 @router.get("/{account_id}/edit", response_class=HTMLResponse)
-async def edit_account_form(
+def edit_account_form(
     request: Request, account_id: int, db: Session = Depends(get_db)
 ):
     """Display edit account form."""
-    account = db.query(Account).filter(Account.id == account_id).first()
+    # The form only renders column values; fail loudly on any lazy load
+    account = db.get(Account, account_id, options=[raiseload("*")])
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
 
+    # The form renders only this row, so updated_at versions the page
+    etag = make_etag(request, "accounts/edit", account.id, account.updated_at)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+
     # Normalize website URL for display (ensure https:// prefix)
     display_website = normalize_url(account.website) if account.website else None
 
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         "accounts/form.html",
         {
             "request": request,
             "account": account,
             "display_website": display_website,
-            "industries": Account.INDUSTRIES,
+            "industries": _INDUSTRIES,
             "is_new": False,
             "error": None,
             "warnings": [],
         },
     )
+    return set_cache_headers(response, etag)
 
 
 @router.post("/{account_id}/edit")
-async def update_account(
+def update_account(
     request: Request,
     account_id: int,
     name: str = Form(...),
@@ -416,10 +601,6 @@ async def update_account(
     db: Session = Depends(get_db),
 ):
     """Update an existing account with validation."""
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
-
     # Build data dict for validation
     data = {
         "name": name,
@@ -431,97 +612,103 @@ async def update_account(
     # Validate account data (exclude self from duplicate check)
     result = validate_account(data, db, existing_id=account_id)
 
-    # If errors, re-render form with error message
-    if not result.is_valid:
-        return templates.TemplateResponse(
-            "accounts/form.html",
-            {
-                "request": request,
-                "account": account,
-                "display_website": normalize_url(website),
-                "industries": Account.INDUSTRIES,
-                "is_new": False,
-                "error": "; ".join(result.errors),
-                "warnings": [],
-                # Override with submitted values
-                "form_name": name,
-                "form_account_type": account_type,
-                "form_industry": industry,
-                "form_website": website,
-                "form_phone": phone,
-                "form_address": address,
-                "form_city": city,
-                "form_state": state,
-                "form_zip_code": zip_code,
-                "form_notes": notes,
-            },
+    # If errors or unconfirmed warnings, re-render the form with the
+    # submitted values; only this path needs the stored account loaded
+    if not result.is_valid or (result.warnings and not confirm_warnings):
+        account = db.get(Account, account_id)
+        if not account:
+            raise HTTPException(status_code=404, detail="Account not found")
+
+        context = _form_context(
+            request,
+            account,
+            result,
+            name=name,
+            account_type=account_type,
+            industry=industry,
+            website=website,
+            phone=phone,
+            address=address,
+            city=city,
+            state=state,
+            zip_code=zip_code,
+            notes=notes,
         )
-
-    # If warnings and not confirmed, show warnings
-    if result.warnings and not confirm_warnings:
-        return templates.TemplateResponse(
-            "accounts/form.html",
-            {
-                "request": request,
-                "account": account,
-                "display_website": normalize_url(website),
-                "industries": Account.INDUSTRIES,
-                "is_new": False,
-                "error": None,
-                "warnings": result.warnings,
-                # Override with submitted values
-                "form_name": name,
-                "form_account_type": account_type,
-                "form_industry": industry,
-                "form_website": website,
-                "form_phone": phone,
-                "form_address": address,
-                "form_city": city,
-                "form_state": state,
-                "form_zip_code": zip_code,
-                "form_notes": notes,
-            },
+        return templates.TemplateResponse("accounts/form.html", context)
+
+    # Single UPDATE round-trip; rowcount doubles as the existence check
+    updated = db.execute(
+        update(Account)
+        .where(Account.id == account_id)
+        .values(
+            **_account_values(
+                name,
+                account_type,
+                website,
+                industry=industry,
+                phone=phone,
+                address=address,
+                city=city,
+                state=state,
+                zip_code=zip_code,
+                notes=notes,
+            ),
         )
-
-    account.name = name
-    account.account_type = account_type or "end_user"
-    account.industry = industry or None
-    account.website = normalize_url(website)
-    account.phone = phone or None
-    account.address = address or None
-    account.city = city or None
-    account.state = state or None
-    account.zip_code = zip_code or None
-    account.notes = notes or None
-
+    )
+    if updated.rowcount == 0:
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Account not found")
     db.commit()
 
     return RedirectResponse(url=f"/accounts/{account_id}", status_code=303)
 
 
 @router.post("/{account_id}/delete")
-async def delete_account(
+def delete_account(
     request: Request, account_id: int, db: Session = Depends(get_db)
 ):
     """Delete an account with safety checks."""
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
-        raise HTTPException(status_code=404, detail="Account not found")
-
-    # Block deletion if account has any opportunities
-    opp_count = (
-        db.query(Opportunity).filter(Opportunity.account_id == account_id).count()
-    )
-    if opp_count > 0:
+    # Block deletion if account has any opportunities. EXISTS stops at the
+    # first match; the count is only needed for the error message.
+    has_opps = db.execute(
+        lambda_stmt(
+            lambda: select(exists().where(Opportunity.account_id == account_id))
+        )
+    ).scalar()
+    if has_opps:
+        opp_count = (
+            db.query(func.count(Opportunity.id))
+            .filter(Opportunity.account_id == account_id)
+            .scalar()
+        )
         raise HTTPException(
             status_code=400,
             detail=f"Cannot delete account with {opp_count} opportunity(ies). Delete opportunities first.",
         )
 
-    # Delete all contacts under this account
-    db.query(Contact).filter(Contact.account_id == account_id).delete()
+    # Do the dependent-row cleanup the ORM delete used to do, explicitly:
+    # SQLite doesn't enforce the ON DELETE rules unless foreign keys are
+    # switched on, and opportunities.end_user_account_id has no rule at all
+    db.execute(
+        update(Opportunity)
+        .where(Opportunity.end_user_account_id == account_id)
+        .values(end_user_account_id=None)
+    )
+    db.execute(
+        update(Task).where(Task.account_id == account_id).values(account_id=None)
+    )
+    db.execute(delete(OpportunityAccount).where(OpportunityAccount.account_id == account_id))
+    db.execute(delete(Contact).where(Contact.account_id == account_id))
 
-    db.delete(account)
+    # rowcount doubles as the existence check
+    deleted = (
+        db.query(Account)
+        .filter(Account.id == account_id)
+        .delete(synchronize_session=False)
+    )
+    if deleted == 0:
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Account not found")
     db.commit()
 
     return RedirectResponse(url="/accounts", status_code=303)
@@ -530,9 +717,13 @@ async def delete_account(
 # -----------------------------
 # API Endpoints (JSON)
 # -----------------------------
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
-from typing import Optional
+
+
+def _full_name(first_name: str, last_name: Optional[str]) -> str:
+    """Same as Contact.full_name, for column-only queries."""
+    if last_name:
+        return f"{first_name} {last_name}"
+    return first_name
 
 
 class QuickCreateAccountRequest(BaseModel):
@@ -543,22 +734,39 @@ class QuickCreateAccountRequest(BaseModel):
 
 
 @router.get("/api/{account_id}/contacts")
-async def api_get_account_contacts(account_id: int, db: Session = Depends(get_db)):
+def api_get_account_contacts(account_id: int, db: Session = Depends(get_db)):
     """API: Get contacts for a specific account (JSON response)."""
-    contacts = (
-        db.query(Contact)
-        .filter(Contact.account_id == account_id)
-        .order_by(Contact.last_name)
-        .all()
+    # Plain column rows, no Contact instances; the payload is already
+    # JSON-safe, so skip FastAPI's jsonable_encoder pass. lambda_stmt caches
+    # the built statement, so warm calls only bind account_id.
+    rows = db.execute(
+        lambda_stmt(
+            lambda: select(
+                Contact.id,
+                Contact.first_name,
+                Contact.last_name,
+                Contact.email,
+                Contact.phone,
+            )
+            .where(Contact.account_id == account_id)
+            .order_by(Contact.last_name)
+        )
+    ).all()
+    return JSONResponse(
+        [
+            {
+                "id": r.id,
+                "full_name": _full_name(r.first_name, r.last_name),
+                "email": r.email,
+                "phone": r.phone,
+            }
+            for r in rows
+        ]
     )
-    return [
-        {"id": c.id, "full_name": c.full_name, "email": c.email, "phone": c.phone}
-        for c in contacts
-    ]
 
 
 @router.get("/api/contacts-for-accounts")
-async def api_get_contacts_for_accounts(
+def api_get_contacts_for_accounts(
     account_ids: str, db: Session = Depends(get_db)
 ):
     """API: Get contacts for multiple accounts (comma-separated IDs)."""
@@ -573,72 +781,84 @@ async def api_get_contacts_for_accounts(
     if not ids:
         return []
 
-    contacts = (
-        db.query(Contact)
+    rows = (
+        db.query(Contact.id, Contact.first_name, Contact.last_name, Account.name)
         .join(Account)
         .filter(Contact.account_id.in_(ids))
         .order_by(Account.name, Contact.last_name)
         .all()
     )
-    return [
-        {
-            "id": c.id,
-            "full_name": c.full_name,
-            "account_name": c.account.name,
-            "display_name": f"{c.full_name} ({c.account.name})",
-        }
-        for c in contacts
-    ]
+    results = []
+    for contact_id, first_name, last_name, account_name in rows:
+        full_name = _full_name(first_name, last_name)
+        results.append(
+            {
+                "id": contact_id,
+                "full_name": full_name,
+                "account_name": account_name,
+                "display_name": f"{full_name} ({account_name})",
+            }
+        )
+    return JSONResponse(results)
 
 
 @router.post("/api/quick-create")
-async def api_quick_create_account(
-    request: Request,
+def api_quick_create_account(
     data: QuickCreateAccountRequest,
     db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
 ):
     """API: Quick create an account from intake modal (JSON response)."""
-    current_user = request.state.current_user
-
-    account = Account(
-        name=data.name,
-        phone=data.phone or None,
-        address=data.address or None,
-        created_by_id=current_user.id,
-    )
-    db.add(account)
+    # INSERT ... RETURNING hands back the new row; no ORM flush or refresh
+    row = db.execute(
+        insert(Account)
+        .values(
+            name=data.name,
+            phone=data.phone or None,
+            address=data.address or None,
+            created_by_id=current_user.id,
+        )
+        .returning(Account.id, Account.name)
+    ).one()
     db.commit()
-    db.refresh(account)
 
-    return {"id": account.id, "name": account.name}
+    return {"id": row.id, "name": row.name}
 
 
 # Column names for Account model (only these can be set)
-ACCOUNT_COLUMNS = {
+ACCOUNT_COLUMNS = frozenset({
     "name", "account_type", "industry", "website", "phone",
     "address", "city", "state", "zip_code", "notes", "awaiting_response", "is_hot",
     "next_action", "next_action_due_date",
-}
+})
+
+# Marks a field the autosave should leave unchanged
+_SKIP = object()
 
 
 @router.post("/{account_id}/toggle-awaiting-response")
-async def toggle_awaiting_response(
+def toggle_awaiting_response(
     account_id: int,
     request: Request,
     db: Session = Depends(get_db),
 ):
     """Toggle the awaiting_response flag on an account."""
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
+    # Flip in the database; RETURNING gives the new value (None if no row)
+    awaiting_response = db.execute(
+        update(Account)
+        .where(Account.id == account_id)
+        .values(awaiting_response=~Account.awaiting_response)
+        .returning(Account.awaiting_response)
+    ).scalar_one_or_none()
+    if awaiting_response is None:
+        db.rollback()
         raise HTTPException(status_code=404, detail="Account not found")
-
-    account.awaiting_response = not account.awaiting_response
     db.commit()
 
     # Return JSON for AJAX requests
     accept_header = request.headers.get("accept", "")
     if "application/json" in accept_header:
-        return {"success": True, "awaiting_response": account.awaiting_response}
+        return {"success": True, "awaiting_response": awaiting_response}
 
     # Redirect back to referring page or account detail for form submissions
     redirect_url = safe_redirect_url(request.query_params.get("from"), f"/accounts/{account_id}")
@@ -646,43 +866,116 @@ async def toggle_awaiting_response(
 
 
 @router.post("/{account_id}/toggle-hot")
-async def toggle_hot(
+def toggle_hot(
     account_id: int,
     request: Request,
     db: Session = Depends(get_db),
 ):
     """Toggle the is_hot flag on an account."""
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
+    is_hot = db.execute(
+        update(Account)
+        .where(Account.id == account_id)
+        .values(is_hot=~Account.is_hot)
+        .returning(Account.is_hot)
+    ).scalar_one_or_none()
+    if is_hot is None:
+        db.rollback()
         raise HTTPException(status_code=404, detail="Account not found")
-
-    account.is_hot = not account.is_hot
     db.commit()
 
     accept_header = request.headers.get("accept", "")
     if "application/json" in accept_header:
-        return {"success": True, "is_hot": account.is_hot}
+        return {"success": True, "is_hot": is_hot}
 
     redirect_url = safe_redirect_url(request.query_params.get("from"), f"/accounts/{account_id}")
     return RedirectResponse(url=redirect_url, status_code=303)
 
 
 @router.post("/{account_id}/clear-next-action")
-async def clear_next_action(
+def clear_next_action(
     account_id: int,
     db: Session = Depends(get_db),
 ):
     """Clear the next action and due date on an account (mark as done)."""
-    account = db.query(Account).filter(Account.id == account_id).first()
-    if not account:
+    cleared = db.execute(
+        update(Account)
+        .where(Account.id == account_id)
+        .values(next_action=None, next_action_due_date=None)
+    )
+    if cleared.rowcount == 0:
+        db.rollback()
         raise HTTPException(status_code=404, detail="Account not found")
-
-    account.next_action = None
-    account.next_action_due_date = None
     db.commit()
     return {"status": "cleared"}
 
 
+def _autosave_name(value):
+    # A blank name is ignored rather than cleared
+    return (str(value).strip() if value else "") or _SKIP
+
+
+def _autosave_account_type(value):
+    return (str(value).strip() if value else "") or "end_user"
+
+
+def _autosave_due_date(value):
+    text = str(value).strip() if value else ""
+    if not text or text == "null":
+        return None
+    return parse_form_date(text)
+
+
+def _autosave_default(value):
+    if isinstance(value, str):
+        return value.strip() or None
+    return value if value else None
+
+
+# Per-field converters; fields not listed use _autosave_default
+_AUTOSAVE_HANDLERS = {
+    "website": lambda value: normalize_url(value) if value else None,
+    "name": _autosave_name,
+    "account_type": _autosave_account_type,
+    "next_action_due_date": _autosave_due_date,
+}
+
+
+def _autosave_values(payload: dict) -> dict:
+    """Convert an autosave payload into Account column values.
+
+    Unknown fields and values that fail to convert are skipped.
+    """
+    values = {}
+    for field, value in payload.items():
+        if field not in ACCOUNT_COLUMNS:
+            continue
+
+        convert = _AUTOSAVE_HANDLERS.get(field, _autosave_default)
+        try:
+            value = convert(value)
+        except Exception:
+            continue
+        if value is not _SKIP:
+            values[field] = value
+    return values
+
+
+def _apply_account_autosave(db: Session, account_id: int, payload: dict) -> None:
+    """Write autosaved fields with a single UPDATE (blocking; run in a thread).
+
+    No SELECT first: a missing account just updates zero rows.
+    """
+    values = _autosave_values(payload)
+    if not values:
+        return
+
+    try:
+        db.execute(update(Account).where(Account.id == account_id).values(**values))
+        db.commit()
+    except Exception:
+        db.rollback()
+
+
 @router.post("/{account_id}/auto-save")
 async def auto_save_account(
     account_id: int,
@@ -691,10 +984,6 @@ async def auto_save_account(
 ):
     """Production-safe autosave. Never raises 422 or 500."""
     try:
-        account = db.query(Account).filter(Account.id == account_id).first()
-        if not account:
-            return {"status": "saved"}
-
         try:
             payload = await request.json()
         except Exception:
@@ -704,37 +993,9 @@ async def auto_save_account(
             except Exception:
                 payload = {}
 
-        for field, value in payload.items():
-            if field not in ACCOUNT_COLUMNS:
-                continue
-
-            try:
-                if field == "website":
-                    account.website = normalize_url(value) if value else None
-                elif field == "name":
-                    val = str(value).strip() if value else ""
-                    if val:
-                        account.name = val
-                elif field == "account_type":
-                    account.account_type = str(value).strip() if value and str(value).strip() else "end_user"
-                elif field == "next_action_due_date":
-                    if value and str(value).strip() and str(value).strip() not in ("null", ""):
-                        from datetime import datetime as dt
-                        account.next_action_due_date = dt.strptime(str(value).strip(), "%Y-%m-%d").date()
-                    else:
-                        account.next_action_due_date = None
-                else:
-                    if isinstance(value, str):
-                        setattr(account, field, value.strip() if value.strip() else None)
-                    else:
-                        setattr(account, field, value if value else None)
-            except Exception:
-                continue
-
-        try:
-            db.commit()
-        except Exception:
-            db.rollback()
+        # The body has to be awaited here, but the database work is blocking,
+        # so keep it off the event loop
+        await run_in_threadpool(_apply_account_autosave, db, account_id, payload)
 
         return {"status": "saved"}
     except Exception:
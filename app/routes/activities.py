@@ -2,13 +2,15 @@ import logging
 from datetime import datetime, date, timedelta
 from fastapi import APIRouter, Request, Depends, Form, HTTPException
 from fastapi.responses import HTMLResponse, RedirectResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, update
+from sqlalchemy.orm import Session, joinedload, load_only, raiseload, selectinload
 
 from typing import List, Optional
 from app.database import get_db
 from app.models import Opportunity, Activity, Contact, ActivityAttendee
-from app.services.followup import calculate_next_followup
+from app.services.followup import add_business_days, calculate_next_followup
 from app.template_config import templates, utc_now
+from app.utils.form_dates import parse_form_date, parse_form_datetime
 from app.utils.safe_redirect import safe_redirect_url
 
 logger = logging.getLogger(__name__)
@@ -16,17 +18,6 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/activities", tags=["activities"])
 
 
-def _add_business_days(start_date: date, num_days: int) -> date:
-    """Add business days (Mon-Fri) to a date, skipping weekends."""
-    current = start_date
-    days_added = 0
-    while days_added < num_days:
-        current += timedelta(days=1)
-        if current.weekday() < 5:
-            days_added += 1
-    return current
-
-
 def _normalize_to_business_day(d: date) -> date:
     """
     Ensure a date falls on a business day (Mon-Fri).
@@ -40,6 +31,18 @@ def _normalize_to_business_day(d: date) -> date:
     return d
 
 
+def _followup_contact(db: Session, activity: Activity) -> Optional[Contact]:
+    """Contact whose follow-up date an activity save updates.
+
+    Reuses the eager-loaded ``activity.contact`` when contact_id is unchanged;
+    a newly assigned contact is fetched by primary key.
+    """
+    contact = activity.contact
+    if contact is not None and contact.id == activity.contact_id:
+        return contact
+    return db.get(Contact, activity.contact_id)
+
+
 
 
 @router.post("/opportunity/{opp_id}/add")
@@ -55,37 +58,49 @@ async def add_activity(
     db: Session = Depends(get_db),
 ):
     """Add an activity to an opportunity."""
-    opportunity = db.query(Opportunity).filter(Opportunity.id == opp_id).first()
+    # Only stage/bid_date are needed for the follow-up calculation
+    opportunity = (
+        db.query(Opportunity.stage, Opportunity.bid_date)
+        .filter(Opportunity.id == opp_id)
+        .first()
+    )
     if not opportunity:
         raise HTTPException(status_code=404, detail="Opportunity not found")
 
     # Parse activity date
     if activity_date:
-        activity_dt = datetime.strptime(activity_date, "%Y-%m-%dT%H:%M")
+        activity_dt = parse_form_datetime(activity_date)
     else:
         activity_dt = utc_now()
 
     current_user = request.state.current_user
-    activity = Activity(
-        opportunity_id=opp_id,
-        activity_type=activity_type,
-        subject=subject,
-        description=description or None,
-        activity_date=activity_dt,
-        contact_id=contact_id if contact_id else None,
-        created_by_id=current_user.id,
+    db.execute(
+        insert(Activity).values(
+            opportunity_id=opp_id,
+            activity_type=activity_type,
+            subject=subject,
+            description=description or None,
+            activity_date=activity_dt,
+            contact_id=contact_id if contact_id else None,
+            created_by_id=current_user.id,
+        )
     )
 
-    db.add(activity)
-
     # Update last_contacted if requested and activity is today or in the past
     if update_last_contacted and activity_dt.date() <= date.today():
-        opportunity.last_contacted = activity_dt.date()
-        # Recalculate followup
-        opportunity.next_followup = calculate_next_followup(
-            stage=opportunity.stage,
-            last_contacted=opportunity.last_contacted,
-            bid_date=opportunity.bid_date,
+        last_contacted = activity_dt.date()
+        db.execute(
+            update(Opportunity)
+            .where(Opportunity.id == opp_id)
+            .values(
+                last_contacted=last_contacted,
+                # Recalculate followup
+                next_followup=calculate_next_followup(
+                    stage=opportunity.stage,
+                    last_contacted=last_contacted,
+                    bid_date=opportunity.bid_date,
+                ),
+            )
         )
 
     db.commit()
@@ -121,7 +136,7 @@ async def add_standalone_activity(
 
     # Parse activity date
     if activity_date:
-        activity_dt = datetime.strptime(activity_date, "%Y-%m-%dT%H:%M")
+        activity_dt = parse_form_datetime(activity_date)
     else:
         activity_dt = utc_now()
 
@@ -143,7 +158,7 @@ async def add_standalone_activity(
         activity.complexity_notes = complexity_notes.strip() if complexity_notes and complexity_notes.strip() else None
         if estimate_needed_by and estimate_needed_by.strip():
             try:
-                activity.estimate_needed_by = datetime.strptime(estimate_needed_by.strip(), "%Y-%m-%d").date()
+                activity.estimate_needed_by = parse_form_date(estimate_needed_by.strip())
             except ValueError:
                 pass
         activity.assigned_estimator_id = assigned_estimator_id if assigned_estimator_id else None
@@ -177,7 +192,7 @@ async def log_meeting(
     contact_ids = [int(v) for v in form_data.getlist("contact_ids") if v]
 
     # Parse activity date
-    activity_dt = datetime.strptime(activity_date, "%Y-%m-%dT%H:%M")
+    activity_dt = parse_form_datetime(activity_date)
 
     # Build subject from attendees if not provided
     if not subject or not subject.strip():
@@ -234,18 +249,15 @@ async def view_activity(
     request: Request, activity_id: int, db: Session = Depends(get_db)
 ):
     """View activity details (read-only)."""
-    from sqlalchemy.orm import selectinload as sl
-
-    activity = (
-        db.query(Activity)
-        .options(
-            sl(Activity.contact).selectinload(Contact.account),
-            sl(Activity.opportunity),
-            sl(Activity.attendee_links).selectinload(ActivityAttendee.contact).selectinload(Contact.account),
-            sl(Activity.walk_segments),
-        )
-        .filter(Activity.id == activity_id)
-        .first()
+    activity = db.get(
+        Activity,
+        activity_id,
+        options=[
+            selectinload(Activity.contact).selectinload(Contact.account),
+            selectinload(Activity.opportunity),
+            selectinload(Activity.attendee_links).selectinload(ActivityAttendee.contact).selectinload(Contact.account),
+            selectinload(Activity.walk_segments),
+        ],
     )
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
@@ -276,8 +288,19 @@ async def edit_activity_form(
     - Prevents full-table queries by requiring account_id filter
     - Logs warning for orphaned activities
     """
-    # 1. Immediate 404 if activity doesn't exist
-    activity = db.query(Activity).filter(Activity.id == activity_id).first()
+    # 1. Immediate 404 if activity doesn't exist. Both to-one relationships
+    # are always consulted below, so load them in the same statement; any
+    # other relationship access raises instead of lazy loading
+    activity = db.get(
+        Activity,
+        activity_id,
+        options=[
+            joinedload(Activity.opportunity),
+            joinedload(Activity.contact),
+            selectinload(Activity.attendee_links),
+            raiseload("*"),
+        ],
+    )
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
 
@@ -300,8 +323,18 @@ async def edit_activity_form(
 
     # 3. Only query contacts if we have a valid account_id (prevents full-table scan)
     if context_account_id is not None:
+        # Dropdown only renders id, full_name and title
         contacts = (
             db.query(Contact)
+            .options(
+                load_only(
+                    Contact.id,
+                    Contact.first_name,
+                    Contact.last_name,
+                    Contact.title,
+                    raiseload=True,
+                )
+            )
             .filter(Contact.account_id == context_account_id)
             .order_by(Contact.last_name)
             .all()
@@ -353,7 +386,7 @@ async def update_activity(
       - other → meeting_requested: apply 2-business-day follow-up
     - Else: preserve existing follow-up
     """
-    activity = db.query(Activity).filter(Activity.id == activity_id).first()
+    activity = db.get(Activity, activity_id, options=[joinedload(Activity.contact)])
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
 
@@ -380,7 +413,7 @@ async def update_activity(
     activity.activity_type = activity_type
     activity.subject = subject
     activity.description = description or None
-    activity.activity_date = datetime.strptime(activity_date, "%Y-%m-%dT%H:%M")
+    activity.activity_date = parse_form_datetime(activity_date)
 
     # For meetings with attendees, update attendee_links and set contact_id to first
     if activity_type == "meeting" and contact_ids:
@@ -395,21 +428,22 @@ async def update_activity(
     # Update contact follow-up date
     # GLOBAL RULE: All follow-up dates are normalized to business days (Mon-Fri)
     if activity.contact_id:
-        contact = db.query(Contact).filter(Contact.id == activity.contact_id).first()
+        contact = _followup_contact(db, activity)
         if contact:
             if next_followup and next_followup.strip():
                 # Manual override: user explicitly set a follow-up date, normalize to business day
-                manual_date = datetime.strptime(next_followup, "%Y-%m-%d").date()
+                manual_date = parse_form_date(next_followup)
                 contact.next_followup = _normalize_to_business_day(manual_date)
             elif type_changed:
                 # Auto-follow-up: only when activity_type changes and no manual date
+                today = date.today()
                 if activity_type == "meeting":
                     # Closing the loop: meeting occurred, set 30-day follow-up (normalized)
-                    contact.last_contacted = date.today()
-                    contact.next_followup = _normalize_to_business_day(date.today() + timedelta(days=30))
+                    contact.last_contacted = today
+                    contact.next_followup = _normalize_to_business_day(today + timedelta(days=30))
                 elif activity_type == "meeting_requested":
                     # New meeting request: set 2-business-day follow-up
-                    contact.next_followup = _add_business_days(date.today(), 2)
+                    contact.next_followup = add_business_days(today, 2)
             # else: no manual date and no type change - preserve existing follow-up
 
     db.commit()
@@ -429,7 +463,7 @@ async def quick_note(
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    activity = db.query(Activity).filter(Activity.id == activity_id).first()
+    activity = db.get(Activity, activity_id)
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
 
@@ -452,7 +486,7 @@ async def delete_activity(
     3. Else if activity.contact_id exists → /contacts/{id}
     4. Else → /summary/my-weekly
     """
-    activity = db.query(Activity).filter(Activity.id == activity_id).first()
+    activity = db.get(Activity, activity_id)
     if not activity:
         raise HTTPException(status_code=404, detail="Activity not found")
 
@@ -479,7 +513,7 @@ async def delete_activity(
 
 
 # Column names for Activity model (only these can be set)
-ACTIVITY_COLUMNS = {
+ACTIVITY_COLUMNS = frozenset({
     "activity_type", "subject", "description", "activity_date",
     "contact_id", "opportunity_id",
     # Job walk fields
@@ -489,7 +523,7 @@ ACTIVITY_COLUMNS = {
     "requires_estimate", "scope_summary", "estimated_quantity",
     "complexity_notes", "estimate_needed_by", "assigned_estimator_id",
     "estimate_completed", "estimate_completed_at",
-}
+})
 
 
 @router.post("/{activity_id}/auto-save")
@@ -500,7 +534,7 @@ async def auto_save_activity(
 ):
     """Production-safe autosave. Never raises 422 or 500."""
     try:
-        activity = db.query(Activity).filter(Activity.id == activity_id).first()
+        activity = db.get(Activity, activity_id, options=[joinedload(Activity.contact)])
         if not activity:
             return {"status": "saved"}
 
@@ -525,7 +559,7 @@ async def auto_save_activity(
             if not v or v in ("", "null"):
                 return None
             try:
-                return datetime.strptime(str(v).strip(), "%Y-%m-%d").date()
+                return parse_form_date(str(v).strip())
             except Exception:
                 return None
 
@@ -535,7 +569,7 @@ async def auto_save_activity(
             val = str(v).strip()
             try:
                 if "T" in val:
-                    return datetime.strptime(val, "%Y-%m-%dT%H:%M")
+                    return parse_form_datetime(val)
                 else:
                     return datetime.strptime(val, "%Y-%m-%d")
             except Exception:
@@ -635,7 +669,7 @@ async def auto_save_activity(
         try:
             type_changed = "activity_type" in payload and old_type != activity.activity_type
             if activity.contact_id:
-                contact = db.query(Contact).filter(Contact.id == activity.contact_id).first()
+                contact = _followup_contact(db, activity)
                 if contact:
                     if "next_followup" in payload:
                         followup_date = clean_date(payload["next_followup"])
@@ -645,11 +679,12 @@ async def auto_save_activity(
                             contact.next_followup = None
                     elif type_changed:
                         # Auto-follow-up: only when activity_type changes and no manual date
+                        today = date.today()
                         if activity.activity_type == "meeting":
-                            contact.last_contacted = date.today()
-                            contact.next_followup = _normalize_to_business_day(date.today() + timedelta(days=30))
+                            contact.last_contacted = today
+                            contact.next_followup = _normalize_to_business_day(today + timedelta(days=30))
                         elif activity.activity_type == "meeting_requested":
-                            contact.next_followup = _add_business_days(date.today(), 2)
+                            contact.next_followup = add_business_days(today, 2)
         except Exception:
             pass
 
@@ -244,7 +244,7 @@ async def create_contact(
         )
 
     # Verify account exists
-    account = db.query(Account).filter(Account.id == account_id).first()
+    account = db.get(Account, account_id)
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
 
@@ -670,7 +670,7 @@ async def quick_create_contact(
         )
 
     # Verify account exists
-    account = db.query(Account).filter(Account.id == account_id).first()
+    account = db.get(Account, account_id)
     if not account:
         return JSONResponse(
             status_code=404,
@@ -698,10 +698,10 @@ async def quick_create_contact(
 
 
 # Column names for Contact model (only these can be set)
-CONTACT_COLUMNS = {
+CONTACT_COLUMNS = frozenset({
     "account_id", "first_name", "last_name", "title", "email",
     "phone", "mobile", "is_primary", "has_responded", "notes", "last_contacted", "next_followup",
-}
+})
 
 
 @router.post("/{contact_id}/toggle-has-responded")
@@ -30,7 +30,7 @@ async def dashboard(request: Request, db: Session = Depends(get_db)):
     data = get_dashboard_data(db, today)
 
     if not USE_DASHBOARD_V2:
-        all_accounts = db.query(Account).order_by(Account.name).all()
+        all_accounts = db.query(Account.id, Account.name).order_by(Account.name).all()
         return templates.TemplateResponse(
             "dashboard/index.html", {"request": request, "all_accounts": all_accounts, **data}
         )
@@ -110,24 +110,18 @@ async def dashboard(request: Request, db: Session = Depends(get_db)):
     )
 
     # Hot accounts — stalest first (oldest last_contacted at top)
-    hot_accounts_all = (
+    # Sort by last_contacted ASC (None = never contacted = top priority)
+    hot_accounts = (
         db.query(Account)
         .options(selectinload(Account.contacts))
         .filter(Account.is_hot == True)
+        .order_by(Account.last_contacted.asc().nullsfirst(), Account.id)
         .all()
     )
-    # Sort by last_contacted ASC (None = never contacted = top priority)
-    hot_accounts_all.sort(
-        key=lambda a: a.last_contacted or date.min,
-    )
-    hot_accounts = hot_accounts_all
 
     # All accounts for job walk modal search
-    all_accounts = (
-        db.query(Account)
-        .order_by(Account.name)
-        .all()
-    )
+    # Only id and name are rendered; plain rows skip ORM hydration
+    all_accounts = db.query(Account.id, Account.name).order_by(Account.name).all()
 
     return templates.TemplateResponse(
         "dashboard/dashboard_v2.html",
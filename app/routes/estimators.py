@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Request, Depends
 from fastapi.responses import HTMLResponse, JSONResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import and_
 from datetime import datetime, timedelta
 from collections import defaultdict
@@ -25,8 +25,10 @@ def calculate_estimator_workload(db: Session, estimator_id: int) -> dict:
             - opportunities: List of opportunity details
     """
     # Get all open opportunities for this estimator
+    # Eager load account for opp_details (opp.account.name)
     opportunities = (
         db.query(Opportunity)
+        .options(selectinload(Opportunity.account))
         .filter(
             and_(
                 Opportunity.assigned_estimator_id == estimator_id,
@@ -15,6 +15,7 @@ from sqlalchemy.orm import Session, selectinload
 from app.database import get_db
 from app.models import Activity, WalkSegment, Account, Contact
 from app.template_config import templates
+from app.utils.form_dates import parse_form_datetime
 from app.utils.safe_redirect import safe_redirect_url
 
 router = APIRouter(prefix="/job-walks", tags=["job_walks"])
@@ -45,7 +46,7 @@ async def job_walks_list(
     completed_walks = [w for w in all_walks if w.job_walk_status == "complete"]
 
     # Data for job walk modal
-    all_accounts = db.query(Account).order_by(Account.name).all()
+    all_accounts = db.query(Account.id, Account.name).order_by(Account.name).all()
     all_contacts = (
         db.query(Contact)
         .options(selectinload(Contact.account))
@@ -83,12 +84,12 @@ async def start_job_walk(
         raise HTTPException(status_code=401, detail="Not authenticated")
 
     # Validate account exists
-    account = db.query(Account).filter(Account.id == account_id).first()
+    account = db.get(Account, account_id)
     if not account:
         raise HTTPException(status_code=400, detail="Account not found")
 
     if activity_date:
-        activity_dt = datetime.strptime(activity_date, "%Y-%m-%dT%H:%M")
+        activity_dt = parse_form_datetime(activity_date)
     else:
         activity_dt = utc_now()
 
@@ -934,7 +934,7 @@ async def calendar_events(db: Session = Depends(get_db)):
 # -----------------------------
 
 # Column names for Opportunity model (only these can be set)
-OPPORTUNITY_COLUMNS = {
+OPPORTUNITY_COLUMNS = frozenset({
     "name", "description", "stage", "probability", "bid_date", "close_date",
     "last_contacted", "next_followup", "bid_type", "submission_method", "bid_time",
     "bid_form_required", "bond_required", "prevailing_wage", "known_risks",
@@ -943,7 +943,7 @@ OPPORTUNITY_COLUMNS = {
     "primary_contact_id", "source", "notes", "related_contact_ids", "quick_links",
     "end_user_account_id", "stalled_reason", "job_walk_required", "job_walk_date",
     "job_walk_time", "job_walk_notes", "job_notes", "primary_account_id", "account_id",
-}
+})
 
 
 @router.post("/{opp_id}/auto-save")
@@ -11,6 +11,7 @@ from typing import Optional, Dict
 
 from fastapi import APIRouter, Request, Depends, Form, Body
 from fastapi.responses import HTMLResponse, RedirectResponse, JSONResponse
+from sqlalchemy import delete, select
 from sqlalchemy.orm import Session, selectinload
 
 from app.database import get_db
@@ -400,7 +401,7 @@ async def save_weekly_note(
         user_id = None
 
     # Validate section
-    if section not in WeeklySummaryNote.SECTIONS:
+    if section not in WeeklySummaryNote.VALID_SECTIONS:
         return RedirectResponse(url=redirect_url, status_code=303)
 
     # Find existing note or create new one
@@ -478,7 +479,7 @@ async def auto_save_note(
             user_id = None
 
         # Validate section - silently succeed if invalid
-        if section not in WeeklySummaryNote.SECTIONS:
+        if section not in WeeklySummaryNote.VALID_SECTIONS:
             return {"status": "saved"}
 
         # Find existing note or create new one
@@ -585,7 +586,7 @@ async def my_weekly_summary(
     section_notes = load_notes_for_week(db, week_start, user_id=user_id)
 
     # All accounts for task modal account selector
-    all_accounts = db.query(Account).order_by(Account.name).all()
+    all_accounts = db.query(Account.id, Account.name).order_by(Account.name).all()
 
     return templates.TemplateResponse(
         "summary/my_weekly.html",
@@ -615,32 +616,33 @@ def get_suppressed_opportunity_ids(db: Session, user_id: int) -> set:
     An opportunity is suppressed UNLESS it has new pipeline activity (Activity with
     "Stage changed" in subject) after the suppression timestamp.
     """
-    suppressions = (
-        db.query(UserSummarySuppression)
-        .filter(UserSummarySuppression.user_id == user_id)
-        .all()
+    # New pipeline activity on the opportunity after the suppression timestamp
+    has_new_activity = (
+        select(Activity.id)
+        .where(
+            Activity.opportunity_id == UserSummarySuppression.opportunity_id,
+            Activity.subject.ilike("%Stage changed%"),
+            Activity.activity_date > UserSummarySuppression.suppressed_at,
+        )
+        .exists()
     )
 
-    suppressed_ids = set()
-    for supp in suppressions:
-        # Check if there's any new pipeline activity after suppression
-        new_activity = (
-            db.query(Activity)
-            .filter(
-                Activity.opportunity_id == supp.opportunity_id,
-                Activity.subject.ilike("%Stage changed%"),
-                Activity.activity_date > supp.suppressed_at,
-            )
-            .first()
-        )
-        if new_activity:
-            # New pipeline activity detected - remove the suppression
-            db.delete(supp)
-            db.commit()
-        else:
-            suppressed_ids.add(supp.opportunity_id)
+    # Remove lifted suppressions in a single DELETE instead of loading and
+    # deleting them one row at a time
+    lifted = db.execute(
+        delete(UserSummarySuppression)
+        .where(UserSummarySuppression.user_id == user_id, has_new_activity)
+        .execution_options(synchronize_session=False)
+    )
+    if lifted.rowcount:
+        db.commit()
 
-    return suppressed_ids
+    rows = (
+        db.query(UserSummarySuppression.opportunity_id)
+        .filter(UserSummarySuppression.user_id == user_id)
+        .all()
+    )
+    return {row[0] for row in rows}
 
 
 @router.post("/suppress-opportunity/{opportunity_id}")
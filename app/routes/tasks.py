@@ -77,10 +77,10 @@ async def add_task(
 
 
 # Column names for Task model (only these can be set)
-TASK_COLUMNS = {
+TASK_COLUMNS = frozenset({
     "title", "description", "due_date", "status",
     "assigned_to_id", "opportunity_id", "account_id", "completed_at", "completed_by_id",
-}
+})
 
 
 @router.post("/{task_id}/quick-update")
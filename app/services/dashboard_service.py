@@ -122,17 +122,22 @@ def get_dashboard_data(db: Session, today: date) -> dict:
     }
 
     estimators = db.query(User).filter(User.role == "Estimator").all()
-    estimator_capacity = []
-    for estimator in estimators:
-        active_count = (
-            db.query(func.count(Opportunity.id))
+    # One grouped count for all estimators instead of a COUNT per estimator
+    active_counts = {}
+    if estimators:
+        rows = (
+            db.query(Opportunity.assigned_estimator_id, func.count(Opportunity.id))
             .filter(
-                Opportunity.assigned_estimator_id == estimator.id,
+                Opportunity.assigned_estimator_id.in_([e.id for e in estimators]),
                 Opportunity.stage.in_(open_stages),
             )
-            .scalar()
-            or 0
+            .group_by(Opportunity.assigned_estimator_id)
+            .all()
         )
+        active_counts = {row[0]: row[1] for row in rows}
+    estimator_capacity = []
+    for estimator in estimators:
+        active_count = active_counts.get(estimator.id, 0)
 
         estimator_capacity.append(
             {
@@ -37,16 +37,24 @@ def add_business_days(start_date: date, num_days: int) -> date:
     Returns:
         The resulting date after adding business days
     """
-    current_date = start_date
-    days_added = 0
-
-    while days_added < num_days:
-        current_date += timedelta(days=1)
-        # Monday = 0, Sunday = 6
-        if current_date.weekday() < 5:  # Monday to Friday
-            days_added += 1
-
-    return current_date
+    if num_days <= 0:
+        return start_date
+
+    # Monday = 0, Sunday = 6. A weekend start counts from the Friday before,
+    # since the first business day after either is the following Monday.
+    weekday = start_date.weekday()
+    if weekday > 4:
+        start_date -= timedelta(days=weekday - 4)
+        weekday = 4
+
+    # Every 5 business days is one calendar week; a remainder that runs past
+    # Friday also skips the weekend
+    full_weeks, remainder = divmod(num_days, 5)
+    days = full_weeks * 7 + remainder
+    if weekday + remainder > 4:
+        days += 2
+
+    return start_date + timedelta(days=days)
 
 
 def calculate_next_followup(
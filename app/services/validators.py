@@ -8,6 +8,7 @@ All validation functions raise ValueError with human-readable messages.
 from datetime import date, timedelta
 from decimal import Decimal
 from typing import Optional, Dict, Any, List
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.models import Account, Contact, Opportunity, OpportunityAccount
@@ -81,14 +82,18 @@ def validate_account(
     name = data.get("name", "").strip() if data.get("name") else ""
 
     if name:
-        # Check for same name (case-insensitive) - this is a blocking error
-        query = db.query(Account).filter(Account.name.ilike(name))
+        # Check for same name (case-insensitive) - this is a blocking error.
+        # lower(name) = lower(:name) hits ix_accounts_lower_name and, unlike
+        # ILIKE, doesn't treat % or _ in the name as wildcards.
+        # Only the stored name is needed for the message, so skip loading
+        # the full Account row.
+        query = db.query(Account.name).filter(func.lower(Account.name) == func.lower(name))
         if existing_id:
             query = query.filter(Account.id != existing_id)
 
-        dupe_by_name = query.first()
-        if dupe_by_name:
-            result.add_error(f"Account already exists: {dupe_by_name.name}")
+        dupe_name = query.limit(1).scalar()
+        if dupe_name:
+            result.add_error(f"Account already exists: {dupe_name}")
 
     # NOTE: City/state duplicates are intentionally NOT checked.
     # Multiple accounts can exist in the same city/state.
@@ -140,7 +145,9 @@ def validate_contact(
 
     # --- DUPLICATE EMAIL (BLOCK) ---
     if email:
-        query = db.query(Contact).filter(Contact.email.ilike(email))
+        # lower(email) = lower(:email) hits ix_contacts_lower_email; ILIKE
+        # would also treat the common "_" in addresses as a wildcard.
+        query = db.query(Contact).filter(func.lower(Contact.email) == func.lower(email))
         if existing_id:
             query = query.filter(Contact.id != existing_id)
 
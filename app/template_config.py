@@ -4,10 +4,24 @@ from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache, TemplateNotFound
+
+from app.utils.url import normalize_url
 
 # App timezone setting - defaults to Central Time
 APP_TIMEZONE = os.getenv("APP_TIMEZONE", "America/Chicago")
 
+# Template reloading on file change is only useful while developing
+TEMPLATE_DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+
+# Hot-path templates compiled at startup so the first request doesn't pay for it
+PREWARM_TEMPLATES = (
+    "accounts/list.html",
+    "accounts/form.html",
+    "accounts/view.html",
+    "activities/edit.html",
+)
+
 
 def get_app_tz() -> ZoneInfo:
     """Get the application timezone."""
@@ -84,6 +98,21 @@ def create_templates() -> Jinja2Templates:
     # Add timezone filters
     templates.env.filters["localtime"] = localtime
     templates.env.filters["localdate"] = localdate
+    templates.env.filters["normalize_url"] = normalize_url
+
+    # In production, skip the per-render mtime check and share compiled
+    # template bytecode across workers and restarts
+    if not TEMPLATE_DEBUG:
+        templates.env.auto_reload = False
+        templates.env.bytecode_cache = FileSystemBytecodeCache()
+        # Loaded templates stay in the environment's cache for reuse
+        for name in PREWARM_TEMPLATES:
+            try:
+                templates.env.get_template(name)
+            except TemplateNotFound:
+                # Imported from outside the project root (scripts); the
+                # template is simply loaded on first render instead
+                pass
 
     return templates
 
@@ -0,0 +1,34 @@
+"""Parsing of HTML date and datetime-local form values.
+
+The expected shapes ("YYYY-MM-DD" and "YYYY-MM-DDTHH:MM") go through the C
+fromisoformat parsers; anything else falls back to strptime with the exact
+format, which accepts or rejects it the same way as before.
+"""
+
+from datetime import date, datetime
+
+DATE_FORMAT = "%Y-%m-%d"
+DATETIME_LOCAL_FORMAT = "%Y-%m-%dT%H:%M"
+
+
+def parse_form_date(value: str) -> date:
+    """Parse a date input value ("YYYY-MM-DD"). Raises ValueError if invalid."""
+    if len(value) == 10:
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    return datetime.strptime(value, DATE_FORMAT).date()
+
+
+def parse_form_datetime(value: str) -> datetime:
+    """Parse a datetime-local input value ("YYYY-MM-DDTHH:MM"). Raises ValueError if invalid."""
+    if len(value) == 16 and value[10] == "T":
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            pass
+        else:
+            if parsed.tzinfo is None:
+                return parsed
+    return datetime.strptime(value, DATETIME_LOCAL_FORMAT)
@@ -0,0 +1,62 @@
+"""Conditional GET helpers (ETag / 304 Not Modified) for HTML pages."""
+
+import hashlib
+import os
+from typing import Optional
+
+from fastapi import Request, Response
+
+# Identifies the deployed code, so a deploy never revalidates a page rendered
+# from old templates. It must be the same in every worker process of a
+# deploy, or a revalidation served by another worker would never match.
+_VERSION_TOKEN = os.getenv("APP_VERSION", "dev")
+
+# Browsers may store the page but must revalidate it on every use
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(request: Request, *parts) -> str:
+    """Build a weak ETag from the given parts.
+
+    The current user (shown in the nav bar) and the query string are always
+    included, since both change the rendered page.
+    """
+    user = getattr(request.state, "current_user", None)
+    user_key = (user.id, user.full_name, user.role) if user else None
+    raw = "|".join(
+        str(p) for p in (_VERSION_TOKEN, user_key, request.url.query, *parts)
+    )
+    return f'W/"{hashlib.sha1(raw.encode("utf-8")).hexdigest()}"'
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 response if the client already has this ETag, else None."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    if etag in candidates or "*" in candidates:
+        return Response(
+            status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        )
+    return None
+
+
+def set_cache_headers(response: Response, etag: str) -> Response:
+    """Attach the ETag and revalidation headers to a full response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return response
+
+
+def conditional_response(request: Request, response: Response) -> Response:
+    """Revalidate an already rendered response by hashing its body.
+
+    For pages whose inputs are too spread out to version cheaply. Rendering
+    still happens, but an unchanged page goes back as an empty 304.
+    """
+    etag = f'W/"{hashlib.sha1(response.body).hexdigest()}"'
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    return set_cache_headers(response, etag)
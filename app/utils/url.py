@@ -0,0 +1,22 @@
+"""Website URL normalization."""
+
+from typing import Optional
+
+# Schemes accepted as-is; anything else gets https:// prepended
+_URL_PREFIXES = ("http://", "https://")
+
+
+def normalize_url(url: Optional[str]) -> Optional[str]:
+    """Prepend https:// if URL doesn't start with http:// or https://.
+
+    Also registered as the `normalize_url` Jinja filter.
+    """
+    if not url:
+        return None
+    # Common case: already has a scheme and nothing to strip
+    if url.startswith(_URL_PREFIXES) and not url[-1].isspace():
+        return url
+    url = url.strip()
+    if not url or url.startswith(_URL_PREFIXES):
+        return url
+    return "https://" + url
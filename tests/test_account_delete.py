@@ -0,0 +1,78 @@
+"""
+Tests for account deletion cleanup.
+
+Deleting an account must not leave rows pointing at it, whether or not the
+database enforces ON DELETE rules (SQLite doesn't unless foreign keys are
+switched on).
+"""
+
+import pytest
+from datetime import date
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import Account, Contact, Opportunity, OpportunityAccount, Task
+from app.routes.accounts import delete_account
+
+
+@pytest.fixture
+def db():
+    """In-memory SQLite session with foreign keys left unenforced."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+class TestDeleteAccount:
+    """Tests for delete_account dependent-row cleanup."""
+
+    def test_delete_leaves_no_orphans(self, db):
+        """Contacts, opportunity links and task/end-user references are cleaned up."""
+        account = Account(name="Acme", account_type="end_user")
+        other = Account(name="Other", account_type="gc")
+        db.add_all([account, other])
+        db.flush()
+        opportunity = Opportunity(
+            name="Job", stage="Prospecting", account_id=other.id,
+            end_user_account_id=account.id, last_contacted=date(2024, 1, 15),
+        )
+        db.add(opportunity)
+        db.flush()
+        db.add_all([
+            Contact(account_id=account.id, first_name="Ann"),
+            Contact(account_id=account.id, first_name="Bob"),
+            Contact(account_id=other.id, first_name="Cid"),
+            OpportunityAccount(opportunity_id=opportunity.id, account_id=account.id),
+            Task(title="Call Acme", account_id=account.id),
+        ])
+        db.commit()
+        account_id = account.id
+
+        response = delete_account(None, account_id, db)
+
+        assert response.status_code == 303
+        db.expire_all()
+        assert db.get(Account, account_id) is None
+        assert db.query(Contact).filter(Contact.account_id == account_id).count() == 0
+        assert db.query(Contact).count() == 1
+        assert db.query(OpportunityAccount).filter(
+            OpportunityAccount.account_id == account_id
+        ).count() == 0
+        assert db.query(Task).one().account_id is None
+        assert db.get(Opportunity, opportunity.id).end_user_account_id is None
+
+    def test_delete_missing_account_404s(self, db):
+        """Deleting an unknown account raises 404."""
+        with pytest.raises(HTTPException) as exc:
+            delete_account(None, 999, db)
+        assert exc.value.status_code == 404
@@ -58,6 +58,22 @@ class TestAddBusinessDays:
         result = add_business_days(start, 0)
         assert result == start
 
+    def test_add_business_days_from_sunday_full_week(self):
+        """Five business days from Sunday lands on the following Friday."""
+        # Sunday Jan 21, 2024
+        start = date(2024, 1, 21)
+        result = add_business_days(start, 5)
+        # Mon 22 .. Fri 26
+        assert result == date(2024, 1, 26)
+
+    def test_add_business_days_multiple_weeks(self):
+        """Adding more than a week of business days skips each weekend."""
+        # Wednesday Jan 17, 2024
+        start = date(2024, 1, 17)
+        result = add_business_days(start, 12)
+        # Two full weeks (Wed Jan 31) plus 2 business days = Friday Feb 2
+        assert result == date(2024, 2, 2)
+
 
 class TestCalculateNextFollowup:
     """Tests for calculate_next_followup function."""
@@ -0,0 +1,59 @@
+"""
+Unit tests for the conditional GET helpers.
+
+ETags must be stable across worker processes of the same deploy, so a
+revalidation served by any worker can return 304.
+"""
+
+import importlib
+from types import SimpleNamespace
+
+from starlette.requests import Request
+
+import app.utils.http_cache as http_cache
+
+
+def _request(query: str = "", user=None) -> Request:
+    request = Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/accounts/new",
+            "query_string": query.encode(),
+            "headers": [],
+        }
+    )
+    request.state.current_user = user
+    return request
+
+
+class TestMakeEtag:
+    """Tests for make_etag."""
+
+    def test_same_inputs_same_etag(self):
+        """Two calls with the same inputs produce the same ETag."""
+        user = SimpleNamespace(id=1, full_name="Ann Admin", role="admin")
+        first = http_cache.make_etag(_request("sort=name", user), "a", 1)
+        second = http_cache.make_etag(_request("sort=name", user), "a", 1)
+        assert first == second
+
+    def test_stable_across_processes_of_one_deploy(self, monkeypatch):
+        """A fresh import (another worker) with the same APP_VERSION matches."""
+        monkeypatch.setenv("APP_VERSION", "abc123")
+        module = importlib.reload(http_cache)
+        first = module.make_etag(_request(), "a")
+        module = importlib.reload(http_cache)
+        assert module.make_etag(_request(), "a") == first
+
+        monkeypatch.setenv("APP_VERSION", "def456")
+        module = importlib.reload(http_cache)
+        assert module.make_etag(_request(), "a") != first
+
+        monkeypatch.undo()
+        importlib.reload(http_cache)
+
+    def test_query_string_changes_etag(self):
+        """Different query strings render different pages."""
+        assert http_cache.make_etag(_request("page=1")) != http_cache.make_etag(
+            _request("page=2")
+        )